@@ -1,6 +1,9 @@
 import asyncio
+import collections
 import datetime
-import csv
+import struct
+import time
+import numpy as np
 from bleak import BleakClient, BleakScanner
 import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
@@ -12,39 +15,126 @@ CHAR_UUID_HRV = "2d30-0001-0000-1000-00805f9b34fb"       # HRV (custom)
 CHAR_UUID_SPO2 = "2d30-0002-0000-1000-00805f9b34fb"      # SpO₂ (custom)
 # ===================================
 
-# Data buffers
-timestamps, hr_data, hrv_data = [], [], []
+# Data buffer: one record per notification in a ring of the last MAX_POINTS.
+# Each record is written twice, at i and i + MAX_POINTS, so the newest window
+# is always one contiguous slice and plotting never copies or reallocates.
+# HR/HRV stay float32 so a value not received yet can be NaN (a plot gap).
+MAX_POINTS = 600
+SAMPLE_DTYPE = np.dtype([('t', 'f4'), ('hr', 'f4'), ('hrv', 'f4')])
+samples = np.full(2 * MAX_POINTS, np.nan, dtype=SAMPLE_DTYPE)
+n_points = 0
+y_peak = 0.0  # max HR/HRV in the buffer, checked against the y-axis limit
+last_hr, last_hrv = None, None
+t_start = time.monotonic()
+
+def push_sample(t, hr, hrv):
+    global n_points, y_peak
+    i = n_points % MAX_POINTS
+    evicted = samples[i]
+    # NaN compares False, so missing values never hold or move the peak
+    peak_evicted = (n_points >= MAX_POINTS and
+                    (evicted['hr'] >= y_peak or evicted['hrv'] >= y_peak))
+    samples[i] = samples[i + MAX_POINTS] = (t, hr, hrv)
+    n_points += 1
+
+    if peak_evicted:
+        # Rescan only when the current maximum leaves the buffer
+        w = window()
+        y_peak = max(np.nanmax(w['hr'], initial=0.0),
+                     np.nanmax(w['hrv'], initial=0.0))
+    else:
+        if hr > y_peak:
+            y_peak = hr
+        if hrv > y_peak:
+            y_peak = hrv
+
+def window():
+    """View of the buffered samples, oldest first."""
+    if n_points < MAX_POINTS:
+        return samples[:n_points]
+    start = n_points % MAX_POINTS
+    return samples[start:start + MAX_POINTS]
 
 # CSV logging
 filename = f"focusband_log_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-csv_file = open(filename, mode='w', newline='')
-csv_writer = csv.writer(csv_file)
-csv_writer.writerow(['Time', 'HR', 'HRV'])
+# Rows are all-numeric apart from the time, so they are formatted straight
+# to bytes; the 1 MiB file buffer does the batching of disk writes.
+csv_file = open(filename, mode='wb', buffering=1 << 20)
+csv_file.write(b'Time,HR,HRV\n')
+
+def log_row(time_now, hr, hrv):
+    csv_file.write(b'%s,%s,%s\n' % (time_now.encode(),
+                                    b'' if hr is None else b'%d' % hr,
+                                    b'' if hrv is None else b'%d' % hrv))
+
+# Wall-clock label, formatted once per second rather than per notification
+_last_sec, _last_str = None, ''
+
+def clock_str(now):
+    global _last_sec, _last_str
+    sec = int(now)
+    if sec != _last_sec:
+        _last_str = time.strftime('%H:%M:%S', time.localtime(sec))
+        _last_sec = sec
+    return _last_str
+
+# Payload decoding: precompiled little-endian unsigned formats by width
+_UNPACK = {1: struct.Struct('<B').unpack_from,
+           2: struct.Struct('<H').unpack_from,
+           4: struct.Struct('<I').unpack_from}
+
+def decode_uint(data):
+    unpack = _UNPACK.get(len(data))
+    if unpack is None:
+        return int.from_bytes(data, byteorder='little')
+    return unpack(data)[0]
+
+def on_hr(hr, time_now):
+    global last_hr
+    last_hr = hr
+    print(f"[{time_now}] ❤️ HR: {hr}")
+
+def on_hrv(hrv, time_now):
+    global last_hrv
+    last_hrv = hrv
+    print(f"[{time_now}] 🔄 HRV: {hrv}")
+
+def on_spo2(spo2, time_now):
+    print(f"[{time_now}] 🫁 SpO2: {spo2}")
+
+HANDLERS = {
+    CHAR_UUID_HR: on_hr,
+    CHAR_UUID_HRV: on_hrv,
+    CHAR_UUID_SPO2: on_spo2,
+}
+
+# BLE notification handler: only decodes and queues, so the bleak event loop
+# is never held up by printing, plotting or CSV I/O. If the consumer falls
+# behind, the bounded queue drops the oldest notifications.
+NOTIFY_QUEUE = collections.deque(maxlen=4096)
+DRAIN_BATCH = 64  # notifications processed per consumer step
+WALL_OFFSET = time.time() - time.monotonic()
 
-# BLE notification handler
 def handle_notify(uuid, data):
-    global timestamps, hr_data, hrv_data
-
-    time_now = datetime.datetime.now().strftime('%H:%M:%S')
-
-    if uuid == CHAR_UUID_HR:
-        hr = int.from_bytes(data, byteorder='little')
-        hr_data.append(hr)
-        print(f"[{time_now}] ❤️ HR: {hr}")
-    elif uuid == CHAR_UUID_HRV:
-        hrv = int.from_bytes(data, byteorder='little')
-        hrv_data.append(hrv)
-        print(f"[{time_now}] 🔄 HRV: {hrv}")
-    elif uuid == CHAR_UUID_SPO2:
-        spo2 = int.from_bytes(data, byteorder='little')
-        print(f"[{time_now}] 🫁 SpO2: {spo2}")
-    else:
-        return
+    if uuid in HANDLERS:
+        NOTIFY_QUEUE.append((uuid, decode_uint(data), time.monotonic()))
+
+def process_notification(uuid, value, mono_ts):
+    time_now = clock_str(mono_ts + WALL_OFFSET)
+    HANDLERS[uuid](value, time_now)
+
+    push_sample(mono_ts - t_start,
+                np.nan if last_hr is None else last_hr,
+                np.nan if last_hrv is None else last_hrv)
 
     # Log to CSV
-    last_hr = hr_data[-1] if hr_data else ''
-    last_hrv = hrv_data[-1] if hrv_data else ''
-    csv_writer.writerow([time_now, last_hr, last_hrv])
+    log_row(time_now, last_hr, last_hrv)
+
+async def drain_notifications():
+    while True:
+        for _ in range(min(len(NOTIFY_QUEUE), DRAIN_BATCH)):
+            process_notification(*NOTIFY_QUEUE.popleft())
+        await asyncio.sleep(0.01 if not NOTIFY_QUEUE else 0)
 
 # Plotting setup
 plt.style.use('seaborn-darkgrid')
@@ -52,14 +142,41 @@ fig, ax = plt.subplots()
 line_hr, = ax.plot([], [], label='HR (bpm)', color='red')
 line_hrv, = ax.plot([], [], label='HRV (ms)', color='blue')
 
+# Fixed axes so each frame only redraws the two lines (blitting). The x axis
+# pages forward by half a window when the newest sample reaches its edge; the
+# y axis grows, with some headroom, when a value overflows it and shrinks back
+# once the buffered peak is well below the top.
+X_WINDOW = 60  # seconds shown
+Y_LIMITS = (0, 200)  # covers HR (bpm) and HRV (ms)
+Y_HEADROOM = 20
+ax.set_xlim(0, X_WINDOW)
+ax.set_ylim(*Y_LIMITS)
+
+def init():
+    return line_hr, line_hrv
+
 def update(frame):
-    if not timestamps:
+    if not n_points:
         return line_hr, line_hrv
-    t = list(range(len(hr_data)))
-    line_hr.set_data(t, hr_data)
-    line_hrv.set_data(t, hrv_data)
-    ax.relim()
-    ax.autoscale_view()
+    w = window()
+    t = w['t']
+    line_hr.set_data(t, w['hr'])
+    line_hrv.set_data(t, w['hrv'])
+
+    rescale = False
+    t_now = t[-1]
+    if t_now > ax.get_xlim()[1]:
+        ax.set_xlim(t_now - X_WINDOW / 2, t_now + X_WINDOW / 2)
+        rescale = True
+    y_top = ax.get_ylim()[1]
+    if y_peak > y_top or (y_top > Y_LIMITS[1] and
+                          y_peak + 2 * Y_HEADROOM < y_top):
+        ax.set_ylim(Y_LIMITS[0], max(Y_LIMITS[1], y_peak + Y_HEADROOM))
+        rescale = True
+    if rescale:
+        # Full redraw for the new ticks; the animated lines are skipped here
+        # and blitted on top afterwards
+        fig.canvas.draw()
     return line_hr, line_hrv
 
 async def main():
@@ -82,18 +199,29 @@ async def main():
         await client.start_notify(CHAR_UUID_HR, handle_notify)
         await client.start_notify(CHAR_UUID_HRV, handle_notify)
         await client.start_notify(CHAR_UUID_SPO2, handle_notify)
+        drain_task = asyncio.create_task(drain_notifications())
 
-        ani = FuncAnimation(fig, update, interval=1000)
+        ani = FuncAnimation(fig, update, init_func=init, interval=1000,
+                            blit=True, cache_frame_data=False)
         plt.legend()
         plt.title("Focus Wristband Live Data")
         plt.xlabel("Time (s)")
         plt.ylabel("Values")
         plt.tight_layout()
-        plt.show()
+
+        # Pump the GUI from the event loop instead of blocking in plt.show(),
+        # so notifications and the drain task keep running
+        plt.show(block=False)
+        while plt.fignum_exists(fig.number):
+            fig.canvas.flush_events()
+            await asyncio.sleep(0.05)
 
         await client.stop_notify(CHAR_UUID_HR)
         await client.stop_notify(CHAR_UUID_HRV)
         await client.stop_notify(CHAR_UUID_SPO2)
+        drain_task.cancel()
+        while NOTIFY_QUEUE:
+            process_notification(*NOTIFY_QUEUE.popleft())
 
 if __name__ == "__main__":
     try:
@@ -1,11 +1,34 @@
+import numpy as np
+from scipy.signal import lfilter
+
+
 class BaselineEMA:
     def __init__(self, alpha=0.05):
-        self.alpha = alpha
+        self.alpha = float(alpha)
         self.ema = None
 
     def update(self, new_value):
         if self.ema is None:
             self.ema = new_value
         else:
-            self.ema = self.alpha * new_value + (1 - self.alpha) * self.ema
+            # Same EMA in increment form: one multiply-add per sample
+            self.ema += self.alpha * (new_value - self.ema)
         return self.ema
+
+
+def ema_series(x, alpha=0.05, init=None):
+    """EMA of a whole series in one call, matching repeated BaselineEMA.update.
+
+    The EMA is the IIR filter y[t] = alpha * x[t] + (1 - alpha) * y[t-1],
+    so scipy's lfilter evaluates it in C. The EMA starts from `init`, or
+    from x[0] when not given. Returns float32.
+    """
+    x = np.asarray(x, dtype=np.float32)
+    if x.size == 0:
+        return x.copy()
+    if init is None:
+        init = x[0]
+    b = np.array([alpha], dtype=np.float32)
+    a = np.array([1, -(1 - alpha)], dtype=np.float32)
+    zi = np.array([(1 - alpha) * init], dtype=np.float32)
+    return lfilter(b, a, x, zi=zi)[0]
@@ -0,0 +1,39 @@
+import numpy as np
+from baseline import ema_series
+
+
+def _sustain(below, sustain):
+    """Flag frames where `below` has held for at least `sustain` frames."""
+    b = below.astype(np.int8)
+    starts = np.flatnonzero(np.diff(b, prepend=0) == 1)
+    ends = np.flatnonzero(np.diff(b, append=0) == -1) + 1  # exclusive
+
+    long_runs = ends - starts >= sustain
+    onsets = starts[long_runs] + sustain - 1
+
+    # +1 where an alert latches, -1 where the run ends; cumsum gives the state
+    marks = np.zeros(b.size + 1, dtype=np.int8)
+    marks[onsets] = 1
+    marks[ends[long_runs]] = -1
+    return np.cumsum(marks[:-1]) > 0
+
+
+def detect_alerts(sdnn, alpha=0.05, drop_pct=0.2, sustain=1):
+    """Track the SDNN baseline and flag frames in a sustained drop.
+
+    A frame is flagged once SDNN has stayed below (1 - drop_pct) * baseline
+    for `sustain` consecutive frames, and stays flagged until SDNN recovers.
+    NaN frames are skipped. Returns (baseline, threshold, alert) arrays.
+    """
+    sdnn = np.asarray(sdnn, dtype=np.float32)
+    valid = ~np.isnan(sdnn)
+
+    baseline = np.full(sdnn.shape, np.nan, dtype=np.float32)
+    baseline[valid] = ema_series(sdnn[valid], alpha)
+    threshold = (1 - drop_pct) * baseline
+
+    # NaN frames compare False, so they count as "not below"
+    below = sdnn < threshold
+    alert = np.zeros(sdnn.shape, dtype=bool)
+    alert[valid] = _sustain(below[valid], max(int(sustain), 1))
+    return baseline, threshold, alert
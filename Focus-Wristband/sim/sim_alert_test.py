@@ -1,33 +1,26 @@
 import numpy as np
 import matplotlib.pyplot as plt
-from algorithm.hrv_metrics import compute_sdnn
-from baseline import BaselineEMA
+from algorithm.hrv_metrics import rolling_sdnn
+from main_logic import detect_alerts
 
 # Simulate RR intervals with a dip in variability
-def generate_rr_stream():
-    np.random.seed(0)
-    normal = np.random.normal(800, 50, size=100)        # Normal HRV
-    dip = np.random.normal(800, 10, size=40)            # Low HRV
-    recover = np.random.normal(800, 50, size=60)        # Recovery
-    return np.concatenate([normal, dip, recover])
+def generate_rr_stream(seed=0):
+    rng = np.random.default_rng(seed)
+    normal = rng.normal(800, 50, size=100)        # Normal HRV
+    dip = rng.normal(800, 10, size=40)            # Low HRV
+    recover = rng.normal(800, 50, size=60)        # Recovery
+    rr = np.concatenate([normal, dip, recover])
+    return np.clip(rr, 300.0, 2000.0).astype(np.float32)  # physiological RR range
 
 rr_stream = generate_rr_stream()
 window_size = 30  # rolling window to compute SDNN
-baseline = BaselineEMA(alpha=0.05)
-sdnn_list = []
-baseline_list = []
-alert_indices = []
 
-for i in range(len(rr_stream) - window_size):
-    window = rr_stream[i:i+window_size]
-    sdnn = compute_sdnn(window)
-    baseline_val = baseline.update(sdnn)
+# SDNN of every full window rr_stream[i:i+window_size]
+sdnn_list = rolling_sdnn(rr_stream, window_size)[window_size - 1:-1]
 
-    sdnn_list.append(sdnn)
-    baseline_list.append(baseline_val)
-
-    if sdnn < 0.8 * baseline_val:  # Trigger alert if SDNN drops 20% below baseline
-        alert_indices.append(i + window_size)
+# Trigger alert if SDNN drops 20% below baseline
+baseline_list, _, alert = detect_alerts(sdnn_list, alpha=0.05, drop_pct=0.2)
+alert_indices = np.flatnonzero(alert) + window_size
 
 # Plot
 plt.plot(sdnn_list, label='SDNN')